@@ -3,7 +3,7 @@
 import sys
 from pathlib import Path
 
-from textualize_mcp.server.mcp_server import mcp
+from textualize_mcp.server.mcp_server import main
 
 # Add the package to Python path
 package_root = Path(__file__).parent
@@ -11,4 +11,4 @@ sys.path.insert(0, str(package_root))
 
 
 if __name__ == "__main__":
-    mcp.run()
+    main()
@@ -0,0 +1,43 @@
+"""Ordering tests for the per-app input batcher."""
+
+import asyncio
+
+from textualize_mcp.server.mcp_server import BatchConfig, _InputBatcher
+
+
+class RecordingApp:
+    """Stand-in app that records when each input starts and finishes."""
+
+    def __init__(self) -> None:
+        self.events: list[tuple[str, str, str]] = []
+
+    async def receive_input(self, input_type: str, input_data: str) -> dict:
+        self.events.append(("start", input_type, input_data))
+        # Keys take longer than text so a text batch could overtake them
+        await asyncio.sleep(0.05 if input_type == "key" else 0.0)
+        self.events.append(("end", input_type, input_data))
+        return {"success": True}
+
+
+async def test_key_text_key_delivered_in_order():
+    batcher = _InputBatcher(BatchConfig(flush_ms=1.0))
+    app = RecordingApp()
+
+    async def send(input_type: str, input_data: str) -> dict:
+        return await batcher.submit(app, "app-1", input_type, input_data)
+
+    first = asyncio.create_task(send("key", "a"))
+    await asyncio.sleep(0)
+    text = asyncio.create_task(send("text", "hello"))
+    await asyncio.sleep(0)
+    last = asyncio.create_task(send("key", "b"))
+    await asyncio.gather(first, text, last)
+
+    assert app.events == [
+        ("start", "key", "a"),
+        ("end", "key", "a"),
+        ("start", "text", "hello"),
+        ("end", "text", "hello"),
+        ("start", "key", "b"),
+        ("end", "key", "b"),
+    ]
@@ -0,0 +1,39 @@
+"""Tests for incremental decoding and line capping in OutputBuffer."""
+
+from textualize_mcp.server.mcp_server import OutputBuffer
+
+
+def test_chunk_with_more_lines_than_capacity_keeps_newest():
+    buffer = OutputBuffer(max_lines=3)
+    buffer.feed(b"a\nb\nc\nd\ne\nf\n")
+
+    assert list(buffer.lines) == ["d", "e", "f"]
+
+
+def test_pending_partial_merges_into_overflowing_chunk():
+    buffer = OutputBuffer(max_lines=2)
+    buffer.feed(b"x")
+    buffer.feed(b"y\n1\n2\n3\n")
+
+    assert list(buffer.lines) == ["2", "3"]
+
+
+def test_multibyte_character_split_across_chunks():
+    buffer = OutputBuffer()
+    buffer.feed("café\n".encode()[:4])
+    buffer.feed("café\n".encode()[4:])
+
+    assert list(buffer.lines) == ["café"]
+
+
+def test_unterminated_tail_is_reported_until_completed():
+    buffer = OutputBuffer(max_lines=3)
+    buffer.feed(b"one\ntwo\nthr")
+
+    assert list(buffer.lines) == ["one", "two"]
+    assert buffer.tail(2) == ["two", "thr"]
+
+    buffer.feed(b"ee\n")
+
+    assert list(buffer.lines) == ["one", "two", "three"]
+    assert buffer.tail(5) == ["one", "two", "three"]
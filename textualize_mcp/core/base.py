@@ -3,6 +3,7 @@
 import asyncio
 import json
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
@@ -22,8 +23,13 @@ class AppConfig(BaseModel):
     requires_sudo: bool = False
 
 
-class AppStatus(BaseModel):
-    """Status information for a running application."""
+@dataclass(slots=True)
+class AppStatus:
+    """Status information for a running application.
+
+    A slotted dataclass rather than a pydantic model: one is built per status
+    query and per tracked app, and the fields need no validation.
+    """
     app_id: str
     name: str
     pid: int | None = None
@@ -31,9 +37,18 @@ class AppStatus(BaseModel):
     start_time: str | None = None
     error_message: str | None = None
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return the fields as a plain dict."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
 
 class BaseTextualApp(App):
-    """Base class for all Textual applications in the MCP server."""
+    """Base class for all Textual applications in the MCP server.
+
+    The interactive methods (``get_screen_state``, ``receive_input``,
+    ``get_detailed_state``, ``get_recent_output``) return plain dicts that the
+    MCP server passes through unchanged, so overrides must not return models.
+    """
     _is_running: bool = False
     APP_CONFIG: AppConfig
     BINDINGS = [
@@ -103,7 +118,7 @@ class BaseTextualApp(App):
         """Get the current screen state for AI interaction.
 
         Returns:
-            Dictionary containing screen data, layout, and interactive elements
+            Plain dictionary containing screen data, layout, and interactive elements
         """
         try:
             # Get basic app state
@@ -138,7 +153,7 @@ class BaseTextualApp(App):
             input_data: The input data to process
 
         Returns:
-            Result of processing the input
+            Plain dictionary describing the result of processing the input
         """
         try:
             result = {"input_type": input_type, "input_data": input_data, "processed": True}
@@ -186,7 +201,7 @@ class BaseTextualApp(App):
         """Get detailed application state including UI state, data, and context.
 
         Returns:
-            Comprehensive state information
+            Plain dictionary with comprehensive state information
         """
         try:
             state = {
@@ -276,7 +291,7 @@ class BaseTextualApp(App):
             lines: Number of recent lines to retrieve
 
         Returns:
-            Recent output data
+            Plain dictionary with recent output data
         """
         try:
             recent_output = self.output_buffer[-lines:] if self.output_buffer else []
@@ -378,12 +393,14 @@ class AppRegistry:
 
     _apps: dict[str, type] = {}
     _running_apps: dict[str, BaseTextualApp] = {}
+    _version: int = 0  # Bumped whenever the set of registered apps changes
 
     @classmethod
     def register(cls, app_class: type) -> None:
         """Register an application class."""
         config = app_class.get_config()
         cls._apps[config.name] = app_class
+        cls._version += 1
 
     @classmethod
     def get_app_class(cls, name: str) -> type | None:
@@ -395,6 +412,16 @@ class AppRegistry:
         """List all registered applications."""
         return [app_class.get_config() for app_class in cls._apps.values()]
 
+    @classmethod
+    def version(cls) -> int:
+        """Get a counter that changes whenever an application is registered."""
+        return cls._version
+
+    @classmethod
+    def count(cls) -> int:
+        """Get the number of registered applications."""
+        return len(cls._apps)
+
     @classmethod
     def get_apps_dict(cls) -> dict[str, type]:
         """Get all registered applications as a name -> class dictionary."""
@@ -0,0 +1,58 @@
+"""Child-process entry point for launching registered Textual applications.
+
+The MCP server starts terminal and web apps through this module instead of
+generating a script per launch::
+
+    python -m textualize_mcp.core.runner <app_name> <app_id> [<encoded args>]
+
+App arguments travel as base64-encoded JSON so they never need shell quoting.
+"""
+
+import base64
+import json
+import sys
+from typing import Any
+
+from textualize_mcp import apps  # noqa: F401  # Required for app auto-registration
+from textualize_mcp.core.base import AppRegistry
+
+RUNNER_MODULE = "textualize_mcp.core.runner"
+
+
+def encode_args(args: dict[str, Any]) -> str:
+    """Encode app arguments into a single shell-safe argv slot."""
+    return base64.urlsafe_b64encode(json.dumps(args).encode()).decode("ascii")
+
+
+def decode_args(encoded: str) -> dict[str, Any]:
+    """Decode app arguments produced by encode_args."""
+    args = json.loads(base64.urlsafe_b64decode(encoded))
+    if not isinstance(args, dict):
+        raise ValueError("app args must be a JSON object")
+    return args
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Instantiate the named app with the given id and run it."""
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) not in (2, 3):
+        sys.exit(f"usage: python -m {RUNNER_MODULE} APP_NAME APP_ID [ARGS]")
+
+    app_name, app_id = argv[0], argv[1]
+    app_class = AppRegistry.get_app_class(app_name)
+    if not app_class:
+        sys.exit(f"Unknown application: {app_name}")
+
+    try:
+        args = decode_args(argv[2]) if len(argv) == 3 else {}
+    except ValueError as e:
+        sys.exit(f"Invalid arguments for {app_name}: {e}")
+
+    app = app_class(**args)
+    app.set_app_id(app_id)
+    app._log_output("App started in subprocess mode")
+    app.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,21 +5,42 @@ Main server that provides MCP interface for managing Textual applications.
 
 import asyncio
 import atexit
-import json
+import codecs
+import copy
 import logging
+import os
+import secrets
+import shlex
+import shutil
 import signal
+import socket
 import sys
-import uuid
+import threading
+import time
+import weakref
+from collections import deque
+from collections.abc import Awaitable, Callable, Coroutine, Iterator, Mapping
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cache, lru_cache
+from itertools import count, islice
+from operator import methodcaller
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Final, TypeVar
 
 from mcp.server.fastmcp import FastMCP
-from pydantic import BaseModel
+
+try:
+    # Optional C-accelerated JSON parser (pip install textualize-mcp[speedups])
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads  # type: ignore[assignment]
 
 # Import apps module to trigger registration decorators
 from textualize_mcp import apps  # noqa: F401  # Required for app auto-registration
 from textualize_mcp.core.base import AppRegistry, AppStatus, BaseTextualApp
+from textualize_mcp.core.runner import RUNNER_MODULE, encode_args
 
 # Configure logging to stderr for MCP servers
 logging.basicConfig(
@@ -29,22 +50,370 @@ logging.basicConfig(
 )
 logger = logging.getLogger("textualize_mcp.server")
 
+_T = TypeVar("_T")
+
+# Millisecond and ISO string of the last timestamp produced by _now_iso()
+_ts_cache: tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """Return the current local time in ISO format, cached per millisecond."""
+    global _ts_cache
+    ms = time.time_ns() // 1_000_000
+    cached_ms, iso = _ts_cache
+    if ms != cached_ms:
+        stamp = datetime.fromtimestamp(ms // 1000).replace(microsecond=ms % 1000 * 1000)
+        iso = stamp.isoformat(timespec="milliseconds")
+        _ts_cache = (ms, iso)
+    return iso
+
+
+# Sequence numbers for generated ids, unique for the server's lifetime
+_id_counter = count(1)
+
+
+def _new_id(prefix: str) -> str:
+    """Return an id such as ``app_1a3f0``: a sequence number plus 16 random bits.
+
+    The counter keeps ids unique within this server; the random suffix keeps
+    them from repeating across restarts.
+    """
+    return f"{prefix}_{next(_id_counter):x}{secrets.token_hex(2)}"
+
+
+# Project root, used as the working directory for launched apps
+_PROJECT_ROOT = Path(__file__).parent.parent.parent
+# Shell-quoted once for the bash payloads of terminal launches
+_PROJECT_ROOT_SH = shlex.quote(str(_PROJECT_ROOT))
 
-class AppLaunchRequest(BaseModel):
+# Terminal emulator argv prefixes; the bash payload is appended per launch
+_TERM_PREFIX: dict[str, tuple[str, ...]] = {
+    "gnome-terminal": ("gnome-terminal", "--", "bash", "-c"),
+    "xterm": ("xterm", "-e", "bash", "-c"),
+    "konsole": ("konsole", "-e", "bash", "-c"),
+    "alacritty": ("alacritty", "-e", "bash", "-c"),
+}
+
+
+@lru_cache(maxsize=64)
+def _terminal_command(terminal_type: str, app_name: str) -> tuple[str, ...]:
+    """Build the argv that runs an app module in a known terminal emulator."""
+    module = shlex.quote(f"textualize_mcp.apps.{app_name}")
+    payload = f"cd {_PROJECT_ROOT_SH} && uv run python -m {module}; read -p 'Press Enter to close...'"
+    return (*_TERM_PREFIX[terminal_type], payload)
+
+
+# Terminal output capture: bytes requested per read by the background drain, also
+# used as the StreamReader limit so the reader buffers at most 2x this before pausing
+_STDOUT_READ_SIZE = 256 * 1024
+# Lines of captured output kept per app; older lines are discarded
+_STDOUT_MAX_LINES = 10_000
+# Longest unterminated line kept while waiting for its newline
+_STDOUT_LINE_LIMIT = 64 * 1024
+
+# First port handed out to web-mode apps that ask for an automatic port
+_WEB_PORT_START = 8000
+
+
+@dataclass(slots=True, frozen=True)
+class AppLaunchRequest:
     """Request model for launching an application."""
     app_name: str
-    args: dict[str, Any] = {}
+    args: dict[str, Any] = field(default_factory=dict)
     web_mode: bool = False
 
 
+@dataclass(slots=True)
+class EnvRecord:
+    """Bookkeeping for a running multiplex environment."""
+    template: str
+    config: list[str]
+    process: asyncio.subprocess.Process
+    started_at: str
+    customizations: dict[str, Any]
+    stopped: bool = False  # Latched once the process has been seen to exit
+
+    @property
+    def process_status(self) -> str:
+        """Return "running" or "stopped"; a stopped environment never restarts."""
+        if not self.stopped and self.process.returncode is not None:
+            self.stopped = True
+        return "stopped" if self.stopped else "running"
+
+
+class OutputBuffer:
+    """Captured stdout of an app, decoded incrementally as bytes arrive."""
+
+    def __init__(self, max_lines: int = _STDOUT_MAX_LINES):
+        # Holds back incomplete multi-byte sequences until the next chunk
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+        self._partial = ""
+        self._max_lines = max_lines
+        self.lines: deque[str] = deque(maxlen=max_lines)
+
+    def feed(self, data: bytes) -> None:
+        """Decode newly read bytes and append any completed lines."""
+        text = self._partial + self._decoder.decode(data)
+        # Split from the right only as far as the deque can hold; if the
+        # leftmost piece merges older lines, extend() pushes it out again
+        *complete, partial = text.rsplit("\n", self._max_lines + 1)
+        self.lines.extend(complete)
+        self._partial = partial[-_STDOUT_LINE_LIMIT:]
+
+    def tail(self, count: int) -> list[str]:
+        """Return up to ``count`` of the most recent lines, oldest first."""
+        if count <= 0:
+            return []
+        recent = [self._partial] if self._partial else []
+        recent.extend(islice(reversed(self.lines), count - len(recent)))
+        recent.reverse()
+        return recent
+
+
+@dataclass(slots=True, frozen=True)
+class BatchConfig:
+    """Limits for coalescing text input sent to an app."""
+    flush_ms: float = 8.0
+    max_chars: int = 100
+
+
+@dataclass(slots=True)
+class _PendingText:
+    """Text queued for one app, waiting to be delivered as a single event."""
+    app: BaseTextualApp
+    parts: list[str]
+    size: int
+    result: asyncio.Future[dict[str, Any]]
+    timer: asyncio.TimerHandle | None = None
+
+
+class _InputBatcher:
+    """Coalesce bursts of text input for an app into one receive_input call.
+
+    Text sent to the same app within ``flush_ms`` is joined and delivered as a
+    single "text" event, and every caller in the batch gets that event's
+    result. Any other input type flushes the app's pending text first, and
+    deliveries for one app run strictly in order.
+    """
+
+    def __init__(self, config: BatchConfig | None = None):
+        self.config = config or BatchConfig()
+        self._pending: dict[str, _PendingText] = {}
+        self._last_delivery: dict[str, asyncio.Task[Any]] = {}
+
+    async def submit(self, app: BaseTextualApp, app_id: str, input_type: str, input_data: str) -> dict[str, Any]:
+        """Send input to an app, batching it with concurrent text input."""
+        if input_type != "text":
+            # Pending text goes first; this event then queues behind it like any delivery
+            self._flush(app_id)
+            delivery = self._enqueue(app_id, lambda: app.receive_input(input_type, input_data))
+            return await asyncio.shield(delivery)
+
+        batch = self._pending.get(app_id)
+        if batch is None:
+            loop = asyncio.get_running_loop()
+            batch = _PendingText(app=app, parts=[], size=0, result=loop.create_future())
+            batch.timer = loop.call_later(self.config.flush_ms / 1000, self._flush, app_id)
+            self._pending[app_id] = batch
+        batch.parts.append(input_data)
+        batch.size += len(input_data)
+        result = batch.result
+        if batch.size >= self.config.max_chars:
+            self._flush(app_id)
+
+        # Shielded so one cancelled caller doesn't cancel delivery for the rest
+        return await asyncio.shield(result)
+
+    def _flush(self, app_id: str) -> None:
+        """Queue delivery of the app's pending text, if any."""
+        batch = self._pending.pop(app_id, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        self._enqueue(app_id, lambda: self._deliver(batch))
+
+    def _enqueue(self, app_id: str, call: Callable[[], Awaitable[_T]]) -> asyncio.Task[_T]:
+        """Run ``call`` once every earlier delivery for the app has finished."""
+        task = asyncio.create_task(self._after(self._last_delivery.get(app_id), call))
+        self._last_delivery[app_id] = task
+
+        def forget(done: asyncio.Task[Any]) -> None:
+            if self._last_delivery.get(app_id) is done:
+                del self._last_delivery[app_id]
+
+        task.add_done_callback(forget)
+        return task
+
+    @staticmethod
+    async def _after(previous: asyncio.Task[Any] | None, call: Callable[[], Awaitable[_T]]) -> _T:
+        if previous is not None:
+            await asyncio.wait([previous])
+        return await call()
+
+    @staticmethod
+    async def _deliver(batch: _PendingText) -> None:
+        try:
+            batch.result.set_result(await batch.app.receive_input("text", "".join(batch.parts)))
+        except Exception as e:
+            batch.result.set_exception(e)
+
+
+class _VersionedCache[T]:
+    """A value built by ``factory``, rebuilt whenever the given version changes."""
+
+    __slots__ = ("_factory", "_version", "_value")
+
+    def __init__(self, factory: Callable[[], T]):
+        self._factory = factory
+        self._version: int | None = None
+        self._value: T | None = None
+
+    def get(self, version: int) -> T:
+        if self._version != version:
+            self._value = self._factory()
+            self._version = version
+        return self._value  # type: ignore[return-value]
+
+
+async def _wait_for_exit(process: asyncio.subprocess.Process) -> int:
+    """Wait for a child process to exit and return its exit code.
+
+    On Linux the wait is driven by a pidfd registered with the event loop, so
+    exit is a single readiness event regardless of the installed child
+    watcher. Elsewhere this falls back to ``process.wait()``.
+    """
+    if process.returncode is None and hasattr(os, "pidfd_open"):
+        try:
+            pidfd = os.pidfd_open(process.pid)
+        except OSError:
+            # Already reaped, or the kernel lacks pidfd support
+            pidfd = None
+        if pidfd is not None:
+            loop = asyncio.get_running_loop()
+            exited: asyncio.Future[None] = loop.create_future()
+
+            def on_exit() -> None:
+                # The pidfd stays readable, so this can fire again before remove_reader
+                if not exited.done():
+                    exited.set_result(None)
+
+            loop.add_reader(pidfd, on_exit)
+            try:
+                await exited
+            finally:
+                loop.remove_reader(pidfd)
+                os.close(pidfd)
+    # Reaps the child; returns immediately once it has exited
+    return await process.wait()
+
+
+def _live_pids() -> frozenset[int] | None:
+    """Return the pids of all live processes from one /proc scan, or None without /proc."""
+    try:
+        return frozenset(int(entry) for entry in os.listdir("/proc") if entry.isdigit())
+    except OSError:
+        return None
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check a single pid with signal 0, for platforms without /proc."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Exists, but owned by another user
+        return True
+    return True
+
+
+# Absolute paths of spawned programs, resolved once per name
+_executables: dict[str, str] = {}
+# Caps concurrent fork/exec calls during launch bursts; one semaphore per event
+# loop, created inside it, since a semaphore binds to the loop that first waits on it
+_spawn_slots: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _loop_spawn_slots() -> asyncio.Semaphore:
+    """Return the running loop's spawn semaphore, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    slots = _spawn_slots.get(loop)
+    if slots is None:
+        slots = _spawn_slots[loop] = asyncio.Semaphore(os.cpu_count() or 4)
+    return slots
+
+
+async def _spawn(program: str, *args: str, **kwargs: Any) -> asyncio.subprocess.Process:
+    """Start a subprocess, keeping it eligible for CPython's posix_spawn fast path.
+
+    Popen only uses posix_spawn instead of fork+exec when the executable is an
+    absolute path, close_fds is False and no cwd is given. Our own descriptors
+    are non-inheritable (O_CLOEXEC), so close_fds=False leaks nothing.
+    """
+    path = _executables.get(program)
+    if path is None:
+        path = shutil.which(program)
+        if path is None:
+            raise FileNotFoundError(f"{program} executable not found on PATH")
+        _executables[program] = path
+    async with _loop_spawn_slots():
+        return await asyncio.create_subprocess_exec(path, *args, close_fds=False, **kwargs)
+
+
+# Interactive methods the collaborative tools may call on a live app
+_INTERACTIVE_METHODS: Final[tuple[str, ...]] = (
+    "get_screen_state",
+    "receive_input",
+    "get_detailed_state",
+    "get_recent_output",
+    "create_session",
+)
+
+
+@cache
+def _app_capabilities(app_class: type[BaseTextualApp]) -> frozenset[str]:
+    """Return which interactive methods an app class provides."""
+    return frozenset(name for name in _INTERACTIVE_METHODS if hasattr(app_class, name))
+
+
+def _without[T](mapping: dict[str, T], key: str) -> dict[str, T]:
+    """Return ``mapping`` minus ``key``, copying only if the key is present."""
+    if key not in mapping:
+        return mapping
+    return {k: v for k, v in mapping.items() if k != key}
+
+
 class AppManager:
     """Manages running Textual applications."""
 
     def __init__(self):
+        # Copy-on-write: running_apps, app_types and app_capabilities are only
+        # rebound to new dicts under _apps_lock, so readers can use (and iterate)
+        # the current mappings without locking
         self.running_apps: dict[str, BaseTextualApp | AppStatus] = {}
+        self._apps_lock = threading.Lock()
+        self.app_types: dict[str, str] = {}  # app_id -> type name, for debugging
         self.app_processes: dict[str, asyncio.subprocess.Process] = {}
-        self.multiplex_environments: dict[str, dict[str, Any]] = {}
+        self.app_output_buffers: dict[str, OutputBuffer] = {}
+        self.multiplex_environments: dict[str, EnvRecord] = {}
+        # Status views per environment, updated on launch, exit and terminate
+        self._env_status: dict[str, dict[str, Any]] = {}
+        self._env_summaries: dict[str, dict[str, Any]] = {}
         self.environment_templates = self._load_environment_templates()
+        # Bound format_map per command, so customizing a launch skips the lookup
+        self._compiled_templates: dict[str, list[Callable[[Mapping[str, Any]], str]]] = {
+            name: [cmd.format_map for cmd in config]
+            for name, config in self.environment_templates.items()
+        }
+        self._port_counter: Iterator[int] = count(_WEB_PORT_START)
+        self.app_threads: dict[str, threading.Thread] = {}  # In-process (collaborative) apps
+        self.app_capabilities: dict[str, frozenset[str]] = {}  # Interactive methods of live apps
+        self._inflight: dict[tuple[Any, ...], asyncio.Future[Any]] = {}
+        # Strong references to monitor tasks, so they aren't collected mid-flight
+        self._background_tasks: set[asyncio.Task[None]] = set()
 
     def _load_environment_templates(self) -> dict[str, list[str]]:
         """Load predefined multiplex environment templates."""
@@ -78,9 +447,95 @@ class AppManager:
             ]
         }
 
+    def allocate_port(self) -> int:
+        """Allocate the next local port that is currently free to bind."""
+        for port in self._port_counter:
+            if port > 65535:
+                break
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+                probe.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                try:
+                    probe.bind(("127.0.0.1", port))
+                except OSError:
+                    continue
+            return port
+        raise RuntimeError("No free ports left for web mode")
+
+    def _start_background_task(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Run a coroutine as a tracked task that removes itself when done."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def cancel_background_tasks(self) -> None:
+        """Cancel all tracked background tasks."""
+        for task in self._background_tasks:
+            task.cancel()
+        self._background_tasks.clear()
+
+    def track_process(self, app_id: str, process: asyncio.subprocess.Process) -> None:
+        """Record an app's subprocess and start draining its stdout into a buffer."""
+        self.app_processes[app_id] = process
+        if process.stdout is not None:
+            output = self.app_output_buffers[app_id] = OutputBuffer()
+            self._start_background_task(self._drain_output(process.stdout, output))
+
+    @staticmethod
+    async def _drain_output(stdout: asyncio.StreamReader, output: OutputBuffer) -> None:
+        """Feed a process's stdout into its output buffer until EOF.
+
+        Reading continuously also keeps the child from blocking on a full pipe.
+        """
+        while chunk := await stdout.read(_STDOUT_READ_SIZE):
+            output.feed(chunk)
+
+    async def coalesced(self, key: tuple[Any, ...], call: Callable[[], Awaitable[_T]]) -> _T:
+        """Run ``call`` once for all concurrent callers that use the same key.
+
+        Bursty polls of the same app share one in-flight call and its result.
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(call())
+            self._inflight[key] = future
+
+            def forget(done: asyncio.Future[Any]) -> None:
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+
+            future.add_done_callback(forget)
+        # Shielded so one cancelled caller doesn't cancel the call for the rest
+        return await asyncio.shield(future)
+
+    def add_running_app(self, app_id: str, app_or_status: BaseTextualApp | AppStatus) -> None:
+        """Store a running app (or its status) and cache its type name and capabilities."""
+        with self._apps_lock:
+            capabilities = dict(self.app_capabilities)
+            if isinstance(app_or_status, BaseTextualApp):
+                capabilities[app_id] = _app_capabilities(type(app_or_status))
+            else:
+                capabilities.pop(app_id, None)
+            self.running_apps = {**self.running_apps, app_id: app_or_status}
+            self.app_types = {**self.app_types, app_id: type(app_or_status).__name__}
+            self.app_capabilities = capabilities
+
+    def remove_running_app(self, app_id: str) -> None:
+        """Forget a running app and its cached type name and capabilities."""
+        with self._apps_lock:
+            self.running_apps = _without(self.running_apps, app_id)
+            self.app_types = _without(self.app_types, app_id)
+            self.app_capabilities = _without(self.app_capabilities, app_id)
+
+    def clear_running_apps(self) -> None:
+        """Forget every running app."""
+        with self._apps_lock:
+            self.running_apps = {}
+            self.app_types = {}
+            self.app_capabilities = {}
+
     def generate_app_id(self) -> str:
         """Generate a unique application ID."""
-        return f"app_{uuid.uuid4().hex[:8]}"
+        return _new_id("app")
 
     async def launch_app(self, app_name: str, args: dict[str, Any] | None = None, web_mode: bool = False, in_process: bool = False, port: int = 8000) -> str:
         """Launch a Textual application.
@@ -105,7 +560,7 @@ class AppManager:
             app.set_app_id(app_id)
 
             # Store reference
-            self.running_apps[app_id] = app
+            self.add_running_app(app_id, app)
             AppRegistry.add_running_app(app_id, app)
 
             if in_process:
@@ -116,124 +571,74 @@ class AppManager:
                 await self._launch_web_app(app_id, app_name, app_args, port)
             else:
                 # Launch in terminal mode (background process)
-                await self._launch_terminal_app(app_id, app)
+                await self._launch_terminal_app(app_id, app, app_args)
 
             return app_id
 
         except Exception as e:
             # Cleanup on failure
-            self.running_apps.pop(app_id, None)
+            self.remove_running_app(app_id)
             AppRegistry.remove_running_app(app_id)
             raise Exception(f"Failed to launch {app_name}: {e}") from e
 
-    async def _launch_terminal_app(self, app_id: str, app: BaseTextualApp) -> None:
+    async def _launch_terminal_app(self, app_id: str, app: BaseTextualApp, args: dict[str, Any]) -> None:
         """Launch app in terminal mode as subprocess while maintaining interactive access."""
-        # Create a script that runs the SAME app instance that's stored in running_apps
-        # This allows interactive functionality to work with the actual running app
-        script_content = f'''#!/usr/bin/env python3
-import sys
-import asyncio
-sys.path.insert(0, r"{Path(__file__).parent.parent.parent}")
-from textualize_mcp.apps.{app.APP_CONFIG.name} import {app.__class__.__name__}
-
-if __name__ == "__main__":
-    # Create app instance with same app_id for interactive functionality
-    app = {app.__class__.__name__}()
-    app.set_app_id("{app_id}")
-
-    # Initialize output buffer for interactive functionality
-    app.output_buffer = []
-    app._log_output("App started in terminal mode")
-
-    app.run()
-'''
-
-        # Write temporary script to temp_apps directory
-        temp_apps_dir = Path(__file__).parent.parent.parent / "temp_apps"
-        temp_apps_dir.mkdir(exist_ok=True)
-        script_path = temp_apps_dir / f"temp_{app_id}.py"
-        script_path.write_text(script_content)
-
-        # Launch the app in terminal with better process tracking
-        process = await asyncio.create_subprocess_exec(
-            "gnome-terminal", "--", "python3", str(script_path),
+        # Run the app through the shared runner module with the SAME app_id that's
+        # stored in running_apps, so interactive functionality can find it
+        process = await _spawn(
+            "gnome-terminal", f"--working-directory={_PROJECT_ROOT}", "--",
+            sys.executable, "-m", RUNNER_MODULE, app.APP_CONFIG.name, app_id, encode_args(args),
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
+            stderr=asyncio.subprocess.STDOUT,
+            limit=_STDOUT_READ_SIZE
         )
 
-        self.app_processes[app_id] = process
+        self.track_process(app_id, process)
 
         # Update the stored app instance to have the process reference
         app.process_id = process.pid if process.pid else None
         app._log_output(f"Terminal launched with PID: {process.pid}")
 
         # Start monitoring the process in background
-        asyncio.create_task(self._monitor_terminal_process(app_id, process))
+        self._start_background_task(self._monitor_terminal_process(app_id, process))
 
     async def _monitor_terminal_process(self, app_id: str, process: asyncio.subprocess.Process) -> None:
         """Monitor a terminal process and clean up when it exits."""
         try:
             # Wait for the process to complete
-            await process.wait()
+            await _wait_for_exit(process)
 
             # Process has ended, clean up
             logger.info(f"Terminal process for app {app_id} has ended (PID: {process.pid})")
 
             # Update app status
-            if app_id in self.running_apps:
-                app = self.running_apps[app_id]
-                if isinstance(app, BaseTextualApp):
-                    app._log_output(f"Terminal process ended, app {app_id} stopped")
-                    # Create a stopped status
-                    status = AppStatus(
-                        app_id=app_id,
-                        name=app.APP_CONFIG.name,
-                        pid=None,
-                        status="stopped",
-                        start_time=getattr(app, '_creation_time', datetime.now().isoformat()),
-                        error_message=None
-                    )
-                    self.running_apps[app_id] = status
+            app = self.running_apps.get(app_id)
+            if isinstance(app, BaseTextualApp):
+                app._log_output(f"Terminal process ended, app {app_id} stopped")
+                # Create a stopped status
+                status = AppStatus(
+                    app_id=app_id,
+                    name=app.APP_CONFIG.name,
+                    pid=None,
+                    status="stopped",
+                    start_time=getattr(app, '_creation_time', _now_iso()),
+                    error_message=None
+                )
+                self.add_running_app(app_id, status)
 
             # Clean up process reference
             self.app_processes.pop(app_id, None)
-
-            # Clean up temp files
-            await self._cleanup_temp_files(app_id)
+            self.app_output_buffers.pop(app_id, None)
 
         except Exception as e:
             logger.error(f"Error monitoring terminal process for app {app_id}: {e}")
 
-    async def _cleanup_temp_files(self, app_id: str) -> None:
-        """Clean up temporary files for an app."""
-        try:
-            temp_apps_dir = Path(__file__).parent.parent.parent / "temp_apps"
-            temp_file_patterns = [
-                f"temp_{app_id}.py",
-                f"temp_web_{app_id}.py"
-            ]
-
-            for pattern in temp_file_patterns:
-                temp_file = temp_apps_dir / pattern
-                if temp_file.exists():
-                    temp_file.unlink()
-                    logger.info(f"Cleaned up temp file: {temp_file}")
-        except Exception as e:
-            logger.warning(f"Failed to clean up temp files for {app_id}: {e}")
-
     async def _launch_in_process_app(self, app_id: str, app: BaseTextualApp) -> None:
         """Launch app in-process for collaborative functionality.
 
         This runs the app in the same process as the MCP server, allowing
         direct method calls for screen capture, input sending, etc.
         """
-        import asyncio
-        from concurrent.futures import ThreadPoolExecutor
-
-        # Create a thread pool executor for running the app
-        if not hasattr(self, '_app_executor'):
-            self._app_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="textual_app")
-
         def run_app_in_thread():
             """Run the Textual app in a separate thread."""
             try:
@@ -248,17 +653,15 @@ if __name__ == "__main__":
                 # Mark app status in case of error by updating the AppStatus
                 status = app.get_status()
                 status.error_message = str(e)
-                self.running_apps[app_id] = status
+                self.add_running_app(app_id, status)
             finally:
                 app._is_running = False
 
-        # Submit the app to run in thread pool
-        future = self._app_executor.submit(run_app_in_thread)
-
-        # Store the future so we can check status or cancel if needed
-        if not hasattr(self, '_app_futures'):
-            self._app_futures = {}
-        self._app_futures[app_id] = future
+        # Each app blocks its thread for its whole lifetime, so give it a dedicated
+        # one; a shared pool would queue further apps behind live ones
+        thread = threading.Thread(target=run_app_in_thread, name=f"textual_app_{app_id}", daemon=True)
+        self.app_threads[app_id] = thread
+        thread.start()
 
         # Give the app a moment to start up
         await asyncio.sleep(0.1)
@@ -271,37 +674,22 @@ if __name__ == "__main__":
         if not app_class:
             raise ValueError(f"Unknown application: {app_name}")
 
-        # Create a script that runs the app directly
-        script_content = f'''#!/usr/bin/env python3
-import sys
-sys.path.insert(0, r"{Path(__file__).parent.parent.parent}")
-from textualize_mcp.apps.{app_name} import {app_class.__name__}
+        # textual serve takes the app command as a single string
+        command = shlex.join([sys.executable, "-m", RUNNER_MODULE, app_name, app_id, encode_args(args)])
+        cmd = ["textual", "serve", command, "--port", str(port)]
 
-if __name__ == "__main__":
-    app = {app_class.__name__}()
-    app.run()
-'''
-
-        # Write temporary script to temp_apps directory
-        temp_apps_dir = Path(__file__).parent.parent.parent / "temp_apps"
-        temp_apps_dir.mkdir(exist_ok=True)
-        script_path = temp_apps_dir / f"temp_web_{app_id}.py"
-        script_path.write_text(script_content)
-
-        # Use textual serve with the script and dynamic port
-        cmd = ["textual", "serve", str(script_path), "--port", str(port)]
-
-        process = await asyncio.create_subprocess_exec(
+        process = await _spawn(
             *cmd,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=Path(__file__).parent.parent.parent
+            stderr=asyncio.subprocess.STDOUT,
+            limit=_STDOUT_READ_SIZE,
+            cwd=_PROJECT_ROOT
         )
 
-        self.app_processes[app_id] = process
+        self.track_process(app_id, process)
 
     async def terminate_app(self, app_id: str) -> bool:
-        """Terminate a running application and clean up temp files."""
+        """Terminate a running application and release its resources."""
         cleanup_successful = True
 
         # Check if app exists in registry
@@ -310,66 +698,47 @@ if __name__ == "__main__":
             return False
 
         # Terminate in-process app if exists
-        if hasattr(self, '_app_futures') and app_id in self._app_futures:
-            future = self._app_futures[app_id]
-            if not future.done():
-                # Try to exit the app gracefully first
-                if app_id in self.running_apps:
-                    app = self.running_apps[app_id]
-                    if isinstance(app, BaseTextualApp):
-                        try:
-                            app.exit()
-                            app._log_output(f"App {app_id} exit requested")
-                        except Exception as e:
-                            logger.warning(f"Failed to gracefully exit app {app_id}: {e}")
-
-                # Cancel the future if still running
-                future.cancel()
-
-            # Clean up future reference
-            del self._app_futures[app_id]
+        thread = self.app_threads.pop(app_id, None)
+        if thread is not None and thread.is_alive():
+            # Ask the app to exit, then wait for its thread off the event loop
+            app = self.running_apps.get(app_id)
+            if isinstance(app, BaseTextualApp):
+                try:
+                    app.exit()
+                    app._log_output(f"App {app_id} exit requested")
+                except Exception as e:
+                    logger.warning(f"Failed to gracefully exit app {app_id}: {e}")
+
+            await asyncio.to_thread(thread.join, 5.0)
+            if thread.is_alive():
+                logger.warning(f"In-process app {app_id} did not exit within 5 seconds")
+                cleanup_successful = False
 
         # Terminate subprocess if exists - handle dead processes gracefully
-        if app_id in self.app_processes:
-            process = self.app_processes[app_id]
+        process = self.app_processes.get(app_id)
+        if process is not None:
             try:
                 # Check if process is still alive
                 if process.returncode is None:
                     process.terminate()
                     try:
-                        await asyncio.wait_for(process.wait(), timeout=5.0)
+                        await asyncio.wait_for(_wait_for_exit(process), timeout=5.0)
                     except TimeoutError:
                         # Force kill if it doesn't terminate gracefully
                         process.kill()
-                        await process.wait()
+                        await _wait_for_exit(process)
                 logger.info(f"Process for app {app_id} terminated successfully")
             except Exception as e:
                 logger.warning(f"Error terminating process for app {app_id}: {e}")
                 cleanup_successful = False
             finally:
                 # Always clean up the process reference
-                del self.app_processes[app_id]
-
-        # Clean up temporary files
-        try:
-            temp_apps_dir = Path(__file__).parent.parent.parent / "temp_apps"
-            temp_file_patterns = [
-                f"temp_{app_id}.py",
-                f"temp_web_app_{app_id}.py"
-            ]
-
-            for pattern in temp_file_patterns:
-                temp_file = temp_apps_dir / pattern
-                if temp_file.exists():
-                    temp_file.unlink()
-                    logger.info(f"Cleaned up temp file: {temp_file}")
-        except Exception as e:
-            logger.warning(f"Failed to clean up temp files for {app_id}: {e}")
-            cleanup_successful = False
+                self.app_processes.pop(app_id, None)
+                self.app_output_buffers.pop(app_id, None)
 
         # Clean up app registry - handle both BaseTextualApp and AppStatus objects
-        if app_id in self.running_apps:
-            app = self.running_apps[app_id]
+        app = self.running_apps.get(app_id)
+        if app is not None:
             if isinstance(app, BaseTextualApp):
                 try:
                     app.exit()
@@ -380,7 +749,7 @@ if __name__ == "__main__":
                 logger.info(f"Removing AppStatus for {app_id}")
 
             # Always remove from registry
-            del self.running_apps[app_id]
+            self.remove_running_app(app_id)
             AppRegistry.remove_running_app(app_id)
             logger.info(f"Successfully terminated and cleaned up app {app_id}")
             return cleanup_successful
@@ -399,13 +768,22 @@ if __name__ == "__main__":
 
     def list_running_apps(self) -> list[AppStatus]:
         """List all running applications."""
-        statuses = []
-        for app_or_status in self.running_apps.values():
-            if isinstance(app_or_status, AppStatus):
-                statuses.append(app_or_status)
-            elif isinstance(app_or_status, BaseTextualApp):
-                statuses.append(app_or_status.get_status())
-        return statuses
+        # Stored statuses are returned as-is; only live apps need get_status()
+        return [
+            app_or_status if isinstance(app_or_status, AppStatus) else app_or_status.get_status()
+            for app_or_status in self.running_apps.values()
+            if isinstance(app_or_status, AppStatus | BaseTextualApp)
+        ]
+
+    async def _spawn_multiplex(self, config: list[str]) -> asyncio.subprocess.Process:
+        """Start a multiplex process for the given service configuration."""
+        # Nothing reads multiplex output, so don't give it pipes that can fill up
+        return await _spawn(
+            "multiplex", *config,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+            cwd=_PROJECT_ROOT
+        )
 
     async def launch_environment(
         self,
@@ -416,87 +794,107 @@ if __name__ == "__main__":
         if template_name not in self.environment_templates:
             raise ValueError(f"Unknown template: {template_name}")
 
-        env_id = f"env_{uuid.uuid4().hex[:8]}"
-        config = self.environment_templates[template_name].copy()
-
+        env_id = _new_id("env")
         # Apply customizations
         if customizations:
-            config = [cmd.format(**customizations) for cmd in config]
+            config = [fmt(customizations) for fmt in self._compiled_templates[template_name]]
+        else:
+            config = self.environment_templates[template_name].copy()
 
         try:
             # Launch multiplex with the configuration
-            multiplex_cmd = ["multiplex"] + config
-
-            process = await asyncio.create_subprocess_exec(
-                *multiplex_cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=Path(__file__).parent.parent.parent
-            )
+            process = await self._spawn_multiplex(config)
 
             # Store environment info
-            self.multiplex_environments[env_id] = {
-                "template": template_name,
-                "config": config,
-                "process": process,
-                "started_at": datetime.now().isoformat(),
-                "customizations": customizations or {}
-            }
+            self._record_environment(env_id, EnvRecord(
+                template=template_name,
+                config=config,
+                process=process,
+                started_at=_now_iso(),
+                customizations=customizations or {}
+            ))
 
             return env_id
 
         except Exception as exc:
             # Cleanup on failure
-            if env_id in self.multiplex_environments:
-                del self.multiplex_environments[env_id]
+            self._forget_environment(env_id)
             raise Exception(f"Failed to launch environment {template_name}: {exc}") from exc
 
     async def create_custom_environment(self, config: list[str]) -> str:
         """Create custom environment from multiplex config."""
-        env_id = f"custom_{uuid.uuid4().hex[:8]}"
+        env_id = _new_id("custom")
 
         try:
-            multiplex_cmd = ["multiplex"] + config
-
-            process = await asyncio.create_subprocess_exec(
-                *multiplex_cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=Path(__file__).parent.parent.parent
-            )
+            process = await self._spawn_multiplex(config)
 
             # Store environment info
-            self.multiplex_environments[env_id] = {
-                "template": "custom",
-                "config": config,
-                "process": process,
-                "started_at": datetime.now().isoformat(),
-                "customizations": {}
-            }
+            self._record_environment(env_id, EnvRecord(
+                template="custom",
+                config=config,
+                process=process,
+                started_at=_now_iso(),
+                customizations={}
+            ))
 
             return env_id
 
         except Exception as e:
             raise Exception(f"Failed to create custom environment: {e}") from e
 
-    def get_environment_status(self, env_id: str) -> dict[str, Any]:
-        """Get comprehensive status of environment."""
-        if env_id not in self.multiplex_environments:
-            return {"status": "error", "error": "Environment not found"}
+    def _record_environment(self, env_id: str, env: EnvRecord) -> None:
+        """Store an environment, build its status views and watch for its exit.
 
-        env = self.multiplex_environments[env_id]
-        process_status = "running" if env["process"].returncode is None else "stopped"
-
-        return {
+        The views are only rewritten on lifecycle events, so status reads don't
+        rebuild them on every poll. They hold their own copies of the config and
+        customizations, so neither the caller's objects nor a reader can change them.
+        """
+        self.multiplex_environments[env_id] = env
+        self._env_status[env_id] = {
             "status": "success",
             "env_id": env_id,
-            "template": env["template"],
-            "process_status": process_status,
-            "started_at": env["started_at"],
-            "config": env["config"],
-            "process_count": len(env["config"]),
-            "customizations": env["customizations"]
+            "template": env.template,
+            "process_status": env.process_status,
+            "started_at": env.started_at,
+            "config": tuple(env.config),
+            "process_count": len(env.config),
+            "customizations": copy.deepcopy(env.customizations)
+        }
+        self._env_summaries[env_id] = {
+            "env_id": env_id,
+            "template": env.template,
+            "status": env.process_status,
+            "started_at": env.started_at,
+            "process_count": len(env.config)
         }
+        self._start_background_task(self._watch_environment(env_id, env))
+
+    async def _watch_environment(self, env_id: str, env: EnvRecord) -> None:
+        """Mark an environment stopped in its status views once its process exits."""
+        await _wait_for_exit(env.process)
+        env.stopped = True
+        if self.multiplex_environments.get(env_id) is env:
+            self._env_status[env_id]["process_status"] = "stopped"
+            self._env_summaries[env_id]["status"] = "stopped"
+
+    def _forget_environment(self, env_id: str) -> None:
+        """Drop an environment and its status views."""
+        self.multiplex_environments.pop(env_id, None)
+        self._env_status.pop(env_id, None)
+        self._env_summaries.pop(env_id, None)
+
+    def clear_environments(self) -> None:
+        """Forget every environment without terminating it."""
+        self.multiplex_environments.clear()
+        self._env_status.clear()
+        self._env_summaries.clear()
+
+    def get_environment_status(self, env_id: str) -> dict[str, Any]:
+        """Get comprehensive status of environment."""
+        status = self._env_status.get(env_id)
+        if status is None:
+            return {"status": "error", "error": "Environment not found"}
+        return {**status, "customizations": copy.deepcopy(status["customizations"])}
 
     async def terminate_environment(self, env_id: str) -> bool:
         """Terminate entire environment gracefully."""
@@ -505,50 +903,44 @@ if __name__ == "__main__":
 
         env = self.multiplex_environments[env_id]
 
-        if env["process"]:
-            env["process"].terminate()
-            await env["process"].wait()
-
-        del self.multiplex_environments[env_id]
+        # Signalling an already-exited process raises ProcessLookupError
+        if env.process_status == "running":
+            env.process.terminate()
+            try:
+                await asyncio.wait_for(_wait_for_exit(env.process), timeout=5.0)
+            except TimeoutError:
+                # Force kill if it doesn't terminate gracefully
+                env.process.kill()
+                await _wait_for_exit(env.process)
+        env.stopped = True
+
+        self._forget_environment(env_id)
         return True
 
     def list_environments(self) -> list[dict[str, Any]]:
         """List all active environments with status."""
-        environments = []
-
-        for env_id, env in self.multiplex_environments.items():
-            process_status = "running" if env["process"].returncode is None else "stopped"
-
-            environments.append({
-                "env_id": env_id,
-                "template": env["template"],
-                "status": process_status,
-                "started_at": env["started_at"],
-                "process_count": len(env["config"])
-            })
-
-        return environments
+        return [dict(summary) for summary in self._env_summaries.values()]
 
     async def terminate_all_apps(self) -> dict[str, Any]:
         """Terminate all running applications and environments."""
-        terminated_apps = []
-        terminated_envs = []
+        app_ids = list(self.running_apps)
+        env_ids = list(self.multiplex_environments)
+
+        # Terminate apps and environments concurrently so graceful-exit timeouts overlap
+        results = await asyncio.gather(
+            *(self.terminate_app(app_id) for app_id in app_ids),
+            *(self.terminate_environment(env_id) for env_id in env_ids),
+            return_exceptions=True
+        )
 
-        # Terminate all running apps
-        for app_id in list(self.running_apps.keys()):
-            try:
-                success = await self.terminate_app(app_id)
-                terminated_apps.append({"app_id": app_id, "success": success})
-            except Exception as e:
-                terminated_apps.append({"app_id": app_id, "success": False, "error": str(e)})
+        def _outcome(key: str, item_id: str, result: bool | BaseException) -> dict[str, Any]:
+            if isinstance(result, BaseException):
+                return {key: item_id, "success": False, "error": str(result)}
+            return {key: item_id, "success": result}
 
-        # Terminate all environments
-        for env_id in list(self.multiplex_environments.keys()):
-            try:
-                success = await self.terminate_environment(env_id)
-                terminated_envs.append({"env_id": env_id, "success": success})
-            except Exception as e:
-                terminated_envs.append({"env_id": env_id, "success": False, "error": str(e)})
+        app_results, env_results = results[:len(app_ids)], results[len(app_ids):]
+        terminated_apps = [_outcome("app_id", a, r) for a, r in zip(app_ids, app_results, strict=True)]
+        terminated_envs = [_outcome("env_id", e, r) for e, r in zip(env_ids, env_results, strict=True)]
 
         return {
             "status": "success",
@@ -567,10 +959,11 @@ if __name__ == "__main__":
         }
 
         # Get app info
+        app_types = self.app_types
         for app_id, app_or_status in self.running_apps.items():
-            app_info = {
+            app_info: dict[str, Any] = {
                 "app_id": app_id,
-                "type": type(app_or_status).__name__,
+                "type": app_types.get(app_id),
                 "has_process": app_id in self.app_processes
             }
             if isinstance(app_or_status, BaseTextualApp):
@@ -593,9 +986,9 @@ if __name__ == "__main__":
         for env_id, env in self.multiplex_environments.items():
             env_info = {
                 "env_id": env_id,
-                "template": env["template"],
-                "process_running": env["process"].returncode is None,
-                "started_at": env["started_at"]
+                "template": env.template,
+                "process_running": env.process_status == "running",
+                "started_at": env.started_at
             }
             running_info["environments"].append(env_info)
 
@@ -614,50 +1007,97 @@ if __name__ == "__main__":
         """Clean up processes that are no longer running."""
         cleaned_apps = []
 
-        # Check each app to see if its process is still alive
-        for app_id in list(self.running_apps.keys()):
-            app_or_status = self.running_apps[app_id]
-
-            # Check if it's an AppStatus with a PID
-            if isinstance(app_or_status, AppStatus) and app_or_status.pid:
-                try:
-                    # Check if process exists using os.kill with signal 0
-                    import os
-                    os.kill(app_or_status.pid, 0)
-                    # Process exists, continue
-                    continue
-                except (OSError, ProcessLookupError):
-                    # Process is dead, clean it up
-                    logger.info(f"Found dead process for app {app_id} (PID: {app_or_status.pid})")
+        # Only stored statuses carry a pid that can go stale
+        candidates = [
+            (app_id, app_or_status) for app_id, app_or_status in self.running_apps.items()
+            if isinstance(app_or_status, AppStatus) and app_or_status.pid
+        ]
+        live_pids = _live_pids() if candidates else None
+
+        for app_id, app_status in candidates:
+            pid = app_status.pid
+            if pid is None:
+                continue
+            if live_pids is not None:
+                alive = pid in live_pids
+            else:
+                alive = _pid_alive(pid)
+            if alive:
+                continue
 
-                    # Update status to stopped
-                    app_or_status.status = "stopped"
-                    app_or_status.pid = None
+            # Process is dead, clean it up
+            logger.info(f"Found dead process for app {app_id} (PID: {pid})")
 
-                    # Clean up process reference if it exists
-                    self.app_processes.pop(app_id, None)
+            # Update status to stopped
+            app_status.status = "stopped"
+            app_status.pid = None
 
-                    # Clean up temp files
-                    await self._cleanup_temp_files(app_id)
+            # Clean up process reference if it exists
+            self.app_processes.pop(app_id, None)
+            self.app_output_buffers.pop(app_id, None)
 
-                    cleaned_apps.append({
-                        "app_id": app_id,
-                        "name": app_or_status.name,
-                        "was_pid": app_or_status.pid,
-                        "status": "cleaned_dead_process"
-                    })
+            cleaned_apps.append({
+                "app_id": app_id,
+                "name": app_status.name,
+                "was_pid": pid,
+                "status": "cleaned_dead_process"
+            })
 
         return {
             "status": "success",
             "cleaned_apps": cleaned_apps,
             "count": len(cleaned_apps),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         }
 
 
+def _ok(**fields: Any) -> dict[str, Any]:
+    """Build a successful tool response."""
+    return {"status": "success", **fields}
+
+
+def _err(message: str, **extra: Any) -> dict[str, Any]:
+    """Build an error tool response."""
+    return {"status": "error", "error": message, **extra}
+
+
+def _err_not_found(app_id: str) -> dict[str, Any]:
+    """Build the error response for an unknown app id."""
+    return _err(f"Application {app_id} not found or not running", app_id=app_id)
+
+
+def _parse_args(args: str | None) -> dict[str, Any]:
+    """Parse a tool's JSON args string into a fresh dict."""
+    if not args:
+        return {}
+    parsed = _json_loads(args)
+    if not isinstance(parsed, dict):
+        raise ValueError("args must be a JSON object")
+    return parsed
+
+
 # Initialize MCP server and app manager
 mcp = FastMCP("Textualize MCP Server")
 app_manager = AppManager()
+input_batcher = _InputBatcher()
+
+
+def _build_app_list() -> list[dict[str, Any]]:
+    return [
+        {
+            "name": config.name,
+            "description": config.description,
+            "version": config.version,
+            "tags": config.tags,
+            "requires_web": config.requires_web,
+            "requires_sudo": config.requires_sudo
+        }
+        for config in AppRegistry.list_apps()
+    ]
+
+
+# list_apps entries for the current registry version
+_app_list_cache: _VersionedCache[list[dict[str, Any]]] = _VersionedCache(_build_app_list)
 
 
 @mcp.tool()
@@ -667,17 +1107,16 @@ def list_apps() -> list[dict[str, Any]]:
     Returns:
         List of application configurations with metadata.
     """
-    app_configs = []
-    for config in AppRegistry.list_apps():
-        app_configs.append({
-            "name": config.name,
-            "description": config.description,
-            "version": config.version,
-            "tags": config.tags,
-            "requires_web": config.requires_web,
-            "requires_sudo": config.requires_sudo
-        })
-    return app_configs
+    return list(_app_list_cache.get(AppRegistry.version()))
+
+
+# Interactive tools available to apps launched in collaborative mode
+_COLLABORATIVE_FEATURES: Final[tuple[str, ...]] = (
+    "Screen capture (capture_app_screen)",
+    "Input sending (send_input_to_app)",
+    "State monitoring (get_app_state)",
+    "Real-time interaction"
+)
 
 
 @mcp.tool()
@@ -694,98 +1133,72 @@ async def launch_app(
         app_name: Name of the application to launch
         args: JSON string of arguments to pass to the application
         launch_mode: Launch mode - 'background', 'web', 'terminal', 'collaborative'
-        port: Port number for web mode
+        port: Port number for web mode (0 picks the next free port)
         terminal_type: Terminal type for terminal mode ('gnome-terminal', 'xterm', 'konsole', 'alacritty')
 
     Returns:
         Application launch result with app_id and mode-specific details.
     """
     try:
-        parsed_args = {}
-        if args:
-            parsed_args = json.loads(args)
+        parsed_args = _parse_args(args)
 
         # Determine launch parameters based on mode
         web_mode = launch_mode == "web"
         in_process = launch_mode == "collaborative"
+        if web_mode and port == 0:
+            port = app_manager.allocate_port()
 
         # Launch the app using the unified AppManager method
         if launch_mode == "terminal":
             # For terminal mode, use the terminal-specific implementation
             app_id = app_manager.generate_app_id()
 
+            if terminal_type not in _TERM_PREFIX:
+                terminal_type = "gnome-terminal"
+
             # Create app status for tracking
             app_status = AppStatus(
                 app_id=app_id,
                 name=app_name,
                 pid=None,
                 status="starting",
-                start_time=datetime.now().isoformat(),
+                start_time=_now_iso(),
                 error_message=None
             )
 
-            # Build terminal command
-            app_module = f"textualize_mcp.apps.{app_name}"
-            base_dir = Path(__file__).parent.parent.parent
-
-            terminal_commands = {
-                "gnome-terminal": [
-                    "gnome-terminal", "--", "bash", "-c",
-                    f"cd {base_dir} && uv run python -m {app_module}; read -p 'Press Enter to close...'"
-                ],
-                "xterm": [
-                    "xterm", "-e", "bash", "-c",
-                    f"cd {base_dir} && uv run python -m {app_module}; read -p 'Press Enter to close...'"
-                ],
-                "konsole": [
-                    "konsole", "-e", "bash", "-c",
-                    f"cd {base_dir} && uv run python -m {app_module}; read -p 'Press Enter to close...'"
-                ],
-                "alacritty": [
-                    "alacritty", "-e", "bash", "-c",
-                    f"cd {base_dir} && uv run python -m {app_module}; read -p 'Press Enter to close...'"
-                ]
-            }
-
-            if terminal_type not in terminal_commands:
-                terminal_type = "gnome-terminal"
-
-            cmd = terminal_commands[terminal_type]
-
             # Launch terminal process
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
+            process = await _spawn(
+                *_terminal_command(terminal_type, app_name),
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+                stderr=asyncio.subprocess.STDOUT,
+                limit=_STDOUT_READ_SIZE
             )
 
             # Update status and store references
             app_status.pid = process.pid
             app_status.status = "running"
-            app_manager.running_apps[app_id] = app_status
-            app_manager.app_processes[app_id] = process
+            app_manager.add_running_app(app_id, app_status)
+            app_manager.track_process(app_id, process)
 
-            return {
-                "status": "success",
-                "app_id": app_id,
-                "app_name": app_name,
-                "launch_mode": launch_mode,
-                "terminal_type": terminal_type,
-                "process_id": process.pid,
-                "message": f"Launched {app_name} in visible {terminal_type} window",
-                "launched_at": datetime.now().isoformat()
-            }
+            return _ok(
+                app_id=app_id,
+                app_name=app_name,
+                launch_mode=launch_mode,
+                terminal_type=terminal_type,
+                process_id=process.pid,
+                message=f"Launched {app_name} in visible {terminal_type} window",
+                launched_at=_now_iso()
+            )
         else:
             # Use standard AppManager launch for other modes
             app_id = await app_manager.launch_app(app_name, parsed_args, web_mode, in_process, port)
 
-            result: dict[str, Any] = {
-                "status": "success",
-                "app_id": app_id,
-                "app_name": app_name,
-                "launch_mode": launch_mode,
-                "launched_at": datetime.now().isoformat()
-            }
+            result: dict[str, Any] = _ok(
+                app_id=app_id,
+                app_name=app_name,
+                launch_mode=launch_mode,
+                launched_at=_now_iso()
+            )
 
             # Add mode-specific details
             if launch_mode == "web":
@@ -797,24 +1210,18 @@ async def launch_app(
                 })
             elif launch_mode == "collaborative":
                 result["message"] = f"Launched {app_name} in collaborative mode with full interactive features"
-                result["collaborative_features"] = [
-                    "Screen capture (capture_app_screen)",
-                    "Input sending (send_input_to_app)",
-                    "State monitoring (get_app_state)",
-                    "Real-time interaction"
-                ]
+                result["collaborative_features"] = _COLLABORATIVE_FEATURES
             else:  # background mode
                 result["message"] = f"Launched {app_name} in background mode"
 
             return result
 
     except Exception as e:
-        return {
-            "status": "error",
-            "error": str(e),
-            "app_name": app_name,
-            "launch_mode": launch_mode
-        }
+        return _err(str(e), app_name=app_name, launch_mode=launch_mode)
+
+
+# get_app_info responses by app name, for the current registry version
+_app_info_cache: _VersionedCache[dict[str, dict[str, Any]]] = _VersionedCache(dict)
 
 
 @mcp.tool()
@@ -827,25 +1234,25 @@ def get_app_info(app_name: str) -> dict[str, Any]:
     Returns:
         Detailed application information.
     """
-    app_class = AppRegistry.get_app_class(app_name)
-    if not app_class:
-        return {
-            "status": "error",
-            "error": f"Unknown application: {app_name}"
-        }
-
-    config = app_class.get_config()
-    return {
-        "status": "success",
-        "name": config.name,
-        "description": config.description,
-        "version": config.version,
-        "author": config.author,
-        "tags": config.tags,
-        "requires_web": config.requires_web,
-        "requires_sudo": config.requires_sudo,
-        "bindings": getattr(app_class, 'BINDINGS', [])
-    }
+    infos = _app_info_cache.get(AppRegistry.version())
+    info = infos.get(app_name)
+    if info is None:
+        app_class = AppRegistry.get_app_class(app_name)
+        if not app_class:
+            return _err(f"Unknown application: {app_name}")
+
+        config = app_class.get_config()
+        info = infos[app_name] = _ok(
+            name=config.name,
+            description=config.description,
+            version=config.version,
+            author=config.author,
+            tags=config.tags,
+            requires_web=config.requires_web,
+            requires_sudo=config.requires_sudo,
+            bindings=getattr(app_class, 'BINDINGS', [])
+        )
+    return dict(info)
 
 
 @mcp.tool()
@@ -861,17 +1268,9 @@ async def terminate_app(app_id: str) -> dict[str, Any]:
     success = await app_manager.terminate_app(app_id)
 
     if success:
-        return {
-            "status": "success",
-            "app_id": app_id,
-            "terminated_at": datetime.now().isoformat()
-        }
+        return _ok(app_id=app_id, terminated_at=_now_iso())
     else:
-        return {
-            "status": "error",
-            "error": f"Application {app_id} not found or already terminated",
-            "app_id": app_id
-        }
+        return _err(f"Application {app_id} not found or already terminated", app_id=app_id)
 
 
 @mcp.tool()
@@ -887,16 +1286,12 @@ def get_app_status(app_id: str) -> dict[str, Any]:
     status = app_manager.get_app_status(app_id)
 
     if status:
-        return {
-            "status": "success",
-            "app_status": status.model_dump()
-        }
+        return _ok(app_status=status.to_dict())
     else:
-        return {
-            "status": "error",
-            "error": f"Application {app_id} not found",
-            "app_id": app_id
-        }
+        return _err(f"Application {app_id} not found", app_id=app_id)
+
+
+_status_to_dict = methodcaller("to_dict")
 
 
 @mcp.tool()
@@ -908,12 +1303,11 @@ def list_running_apps() -> dict[str, Any]:
     """
     running_apps = app_manager.list_running_apps()
 
-    return {
-        "status": "success",
-        "running_apps": [app.model_dump() for app in running_apps],
-        "count": len(running_apps),
-        "timestamp": datetime.now().isoformat()
-    }
+    return _ok(
+        running_apps=list(map(_status_to_dict, running_apps)),
+        count=len(running_apps),
+        timestamp=_now_iso()
+    )
 
 
 @mcp.tool()
@@ -928,38 +1322,23 @@ async def capture_app_screen(app_id: str) -> dict[str, Any]:
     """
     app = app_manager.running_apps.get(app_id)
     if not app:
-        return {
-            "status": "error",
-            "error": f"Application {app_id} not found or not running"
-        }
+        return _err_not_found(app_id)
 
     try:
-        # Ensure app is BaseTextualApp instance with screen capture capability
-        if isinstance(app, BaseTextualApp) and hasattr(app, 'get_screen_state'):
+        # Ensure app is a live BaseTextualApp with screen capture capability
+        if isinstance(app, BaseTextualApp) and 'get_screen_state' in app_manager.app_capabilities.get(app_id, ()):
             # Check if app is running in-process (required for collaborative features)
-            if not (hasattr(app_manager, '_app_futures') and app_id in app_manager._app_futures):
-                return {
-                    "status": "error",
-                    "error": f"Application {app_id} must be running in-process for screen capture. Please launch with in_process=True or use open_collaborative_session."
-                }
-
-            screen_data = await app.get_screen_state()
-            return {
-                "status": "success",
-                "app_id": app_id,
-                "screen_data": screen_data,
-                "timestamp": datetime.now().isoformat()
-            }
+            if app_id not in app_manager.app_threads:
+                return _err(
+                    f"Application {app_id} must be running in-process for screen capture. Please launch with in_process=True or use open_collaborative_session."
+                )
+
+            screen_data = await app_manager.coalesced((app_id, "screen"), app.get_screen_state)
+            return _ok(app_id=app_id, screen_data=screen_data, timestamp=_now_iso())
         else:
-            return {
-                "status": "error",
-                "error": "Screen capture not supported for this application"
-            }
+            return _err("Screen capture not supported for this application")
     except Exception as e:
-        return {
-            "status": "error",
-            "error": f"Failed to capture screen: {e}"
-        }
+        return _err(f"Failed to capture screen: {e}")
 
 
 @mcp.tool()
@@ -976,38 +1355,27 @@ async def send_input_to_app(app_id: str, input_type: str, input_data: str) -> di
     """
     app = app_manager.running_apps.get(app_id)
     if not app:
-        return {
-            "status": "error",
-            "error": f"Application {app_id} not found or not running"
-        }
+        return _err_not_found(app_id)
 
     try:
-        if isinstance(app, BaseTextualApp) and hasattr(app, 'receive_input'):
+        if isinstance(app, BaseTextualApp) and 'receive_input' in app_manager.app_capabilities.get(app_id, ()):
             # Check if app is running in-process (required for collaborative features)
-            if not (hasattr(app_manager, '_app_futures') and app_id in app_manager._app_futures):
-                return {
-                    "status": "error",
-                    "error": f"Application {app_id} must be running in-process for input sending. Please launch with in_process=True or use open_collaborative_session."
-                }
-
-            result = await app.receive_input(input_type, input_data)
-            return {
-                "status": "success",
-                "app_id": app_id,
-                "input_sent": f"{input_type}: {input_data}",
-                "result": result,
-                "timestamp": datetime.now().isoformat()
-            }
+            if app_id not in app_manager.app_threads:
+                return _err(
+                    f"Application {app_id} must be running in-process for input sending. Please launch with in_process=True or use open_collaborative_session."
+                )
+
+            result = await input_batcher.submit(app, app_id, input_type, input_data)
+            return _ok(
+                app_id=app_id,
+                input_sent=f"{input_type}: {input_data}",
+                result=result,
+                timestamp=_now_iso()
+            )
         else:
-            return {
-                "status": "error",
-                "error": "Input sending not supported for this application"
-            }
+            return _err("Input sending not supported for this application")
     except Exception as e:
-        return {
-            "status": "error",
-            "error": f"Failed to send input: {e}"
-        }
+        return _err(f"Failed to send input: {e}")
 
 
 @mcp.tool()
@@ -1022,46 +1390,27 @@ async def get_app_state(app_id: str) -> dict[str, Any]:
     """
     app = app_manager.running_apps.get(app_id)
     if not app:
-        return {
-            "status": "error",
-            "error": f"Application {app_id} not found or not running"
-        }
+        return _err_not_found(app_id)
 
     try:
-        if isinstance(app, BaseTextualApp) and hasattr(app, 'get_detailed_state'):
-            state_data = await app.get_detailed_state()
-            return {
-                "status": "success",
-                "app_id": app_id,
-                "state": state_data,
-                "timestamp": datetime.now().isoformat()
-            }
+        if isinstance(app, BaseTextualApp) and 'get_detailed_state' in app_manager.app_capabilities.get(app_id, ()):
+            state_data = await app_manager.coalesced((app_id, "state"), app.get_detailed_state)
+            return _ok(app_id=app_id, state=state_data, timestamp=_now_iso())
         else:
             # Fallback to basic status
-            if isinstance(app, BaseTextualApp):
-                basic_status = app.get_status().model_dump()
-            elif isinstance(app, AppStatus):
-                basic_status = app.model_dump()
-            else:
-                return {
-                    "status": "error",
-                    "error": "Basic status not available for this object",
-                    "app_id": app_id
-                }
-            return {
-                "status": "success",
-                "app_id": app_id,
-                "state": {
-                    "basic_status": basic_status,
+            status = app_manager.get_app_status(app_id)
+            if status is None:
+                return _err("Basic status not available for this object", app_id=app_id)
+            return _ok(
+                app_id=app_id,
+                state={
+                    "basic_status": status.to_dict(),
                     "note": "Detailed state not available - using basic status"
                 },
-                "timestamp": datetime.now().isoformat()
-            }
+                timestamp=_now_iso()
+            )
     except Exception as e:
-        return {
-            "status": "error",
-            "error": f"Failed to get state: {e}"
-        }
+        return _err(f"Failed to get state: {e}")
 
 
 @mcp.tool()
@@ -1077,37 +1426,25 @@ async def create_interactive_session(app_id: str, session_type: str = "shared")
     """
     app = app_manager.running_apps.get(app_id)
     if not app:
-        return {
-            "status": "error",
-            "error": f"Application {app_id} not found or not running"
-        }
+        return _err_not_found(app_id)
 
     try:
-        session_id = f"session_{uuid.uuid4().hex[:8]}"
-
-        from textualize_mcp.core.base import BaseTextualApp
+        session_id = _new_id("session")
 
-        if isinstance(app, BaseTextualApp) and hasattr(app, 'create_session'):
+        if isinstance(app, BaseTextualApp) and 'create_session' in app_manager.app_capabilities.get(app_id, ()):
             session_data = await app.create_session(session_id, session_type)
-            return {
-                "status": "success",
-                "app_id": app_id,
-                "session_id": session_id,
-                "session_type": session_type,
-                "session_data": session_data,
-                "message": f"Interactive session created! Both AI and user can now interact with {app.APP_CONFIG.name}",
-                "timestamp": datetime.now().isoformat()
-            }
+            return _ok(
+                app_id=app_id,
+                session_id=session_id,
+                session_type=session_type,
+                session_data=session_data,
+                message=f"Interactive session created! Both AI and user can now interact with {app.APP_CONFIG.name}",
+                timestamp=_now_iso()
+            )
         else:
-            return {
-                "status": "error",
-                "error": "Interactive sessions not supported for this application"
-            }
+            return _err("Interactive sessions not supported for this application")
     except Exception as e:
-        return {
-            "status": "error",
-            "error": f"Failed to create session: {e}"
-        }
+        return _err(f"Failed to create session: {e}")
 
 
 @mcp.tool()
@@ -1123,31 +1460,23 @@ async def read_app_output(app_id: str, lines: int = 50) -> dict[str, Any]:
     """
     app = app_manager.running_apps.get(app_id)
     if not app:
-        return {
-            "status": "error",
-            "error": f"Application {app_id} not found or not running"
-        }
+        return _err_not_found(app_id)
 
     try:
-        if isinstance(app, BaseTextualApp) and hasattr(app, 'get_recent_output'):
-            output_data = await app.get_recent_output(lines)
-            return {
-                "status": "success",
-                "app_id": app_id,
-                "output": output_data,
-                "lines_requested": lines,
-                "timestamp": datetime.now().isoformat()
-            }
+        if isinstance(app, BaseTextualApp) and 'get_recent_output' in app_manager.app_capabilities.get(app_id, ()):
+            output_data = await app_manager.coalesced(
+                (app_id, "output", lines), lambda: app.get_recent_output(lines)
+            )
+            return _ok(
+                app_id=app_id,
+                output=output_data,
+                lines_requested=lines,
+                timestamp=_now_iso()
+            )
         else:
-            return {
-                "status": "error",
-                "error": "Output reading not supported for this application yet"
-            }
+            return _err("Output reading not supported for this application yet")
     except Exception as e:
-        return {
-            "status": "error",
-            "error": f"Failed to read output: {e}"
-        }
+        return _err(f"Failed to read output: {e}")
 
 
 # REMOVED: launch_app_in_terminal - functionality now integrated into main launch_app method
@@ -1169,97 +1498,65 @@ async def capture_terminal_output(app_id: str, lines: int = 50) -> dict[str, Any
     Returns:
         Terminal output content and visual state
     """
-    if app_id not in app_manager.app_processes:
-        return {
-            "status": "error",
-            "error": f"No terminal process found for app {app_id}"
-        }
+    process = app_manager.app_processes.get(app_id)
+    if process is None:
+        return _err(f"No terminal process found for app {app_id}")
 
-    try:
-        process = app_manager.app_processes[app_id]
-
-        if process.stdout:
-            # Try to read available output
-            try:
-                stdout_data = b""
-                while True:
-                    try:
-                        chunk = await process.stdout.read(1024)
-                        if not chunk:
-                            break
-                        stdout_data += chunk
-                    except Exception:
-                        break
-
-                terminal_output = stdout_data.decode('utf-8', errors='ignore')
-                output_lines = terminal_output.split('\n')[-lines:] if terminal_output else []
-
-                return {
-                    "status": "success",
-                    "app_id": app_id,
-                    "terminal_output": output_lines,
-                    "lines_captured": len(output_lines),
-                    "process_status": "running" if process.returncode is None else "stopped",
-                    "timestamp": datetime.now().isoformat()
-                }
-
-            except Exception as read_error:
-                return {
-                    "status": "partial_success",
-                    "app_id": app_id,
-                    "message": "Process running but output not accessible in this mode",
-                    "process_status": "running" if process.returncode is None else "stopped",
-                    "suggestion": "Use visible terminal or web browser mode for better output capture",
-                    "error": str(read_error),
-                    "timestamp": datetime.now().isoformat()
-                }
-        else:
-            return {
-                "status": "error",
-                "error": "Process has no stdout stream available"
-            }
+    # Output is drained in the background as it arrives; this only reads the tail
+    output = app_manager.app_output_buffers.get(app_id)
+    if output is None:
+        return _err("Process has no stdout stream available")
 
+    try:
+        output_lines = output.tail(lines)
+        return _ok(
+            app_id=app_id,
+            terminal_output=output_lines,
+            lines_captured=len(output_lines),
+            process_status="running" if process.returncode is None else "stopped",
+            timestamp=_now_iso()
+        )
     except Exception as e:
-        return {
-            "status": "error",
-            "error": f"Failed to capture terminal output: {e}"
-        }
+        return _err(f"Failed to capture terminal output: {e}")
 
 
 # REMOVED: open_collaborative_session - functionality now integrated into main launch_app method
 # Use launch_app(app_name, launch_mode="collaborative") instead
+
+
+_SUPPORTED_FEATURES: Final[tuple[str, ...]] = (
+    "app_management",
+    "web_deployment",
+    "terminal_mode",
+    "process_monitoring",
+    "file_management",
+    "interactive_sessions",
+    "screen_capture",
+    "input_injection",
+    "real_time_collaboration",
+    "ai_app_interaction",
+    "visible_terminal_launch",
+    "web_browser_launch",
+    "collaborative_sessions",
+    "terminal_output_capture"
+)
+
+
+@mcp.tool()
+def get_server_info() -> dict[str, Any]:
     """Get information about the MCP server.
 
     Returns:
         Server information and statistics.
     """
-    available_apps = AppRegistry.list_apps()
-    running_apps = app_manager.list_running_apps()
-
-    return {
-        "status": "success",
-        "server_name": "Textualize MCP Server",
-        "version": "1.0.0",
-        "available_apps": len(available_apps),
-        "running_apps": len(running_apps),
-        "supported_features": [
-            "app_management",
-            "web_deployment",
-            "terminal_mode",
-            "process_monitoring",
-            "file_management",
-            "interactive_sessions",
-            "screen_capture",
-            "input_injection",
-            "real_time_collaboration",
-            "ai_app_interaction",
-            "visible_terminal_launch",
-            "web_browser_launch",
-            "collaborative_sessions",
-            "terminal_output_capture"
-        ],
-        "timestamp": datetime.now().isoformat()
-    }
+    return _ok(
+        server_name="Textualize MCP Server",
+        version="1.0.0",
+        available_apps=AppRegistry.count(),
+        running_apps=len(app_manager.running_apps),
+        supported_features=_SUPPORTED_FEATURES,
+        timestamp=_now_iso()
+    )
 
 
 @mcp.tool()
@@ -1273,24 +1570,27 @@ def debug_running_apps() -> dict[str, Any]:
         debug_info = {
             "running_apps_count": len(app_manager.running_apps),
             "app_processes_count": len(app_manager.app_processes),
-            "running_apps_keys": list(app_manager.running_apps.keys()),
-            "app_processes_keys": list(app_manager.app_processes.keys()),
-            "running_apps_types": {
-                app_id: type(obj).__name__
-                for app_id, obj in app_manager.running_apps.items()
-            }
-        }
-        return {
-            "status": "success",
-            "debug_info": debug_info,
-            "timestamp": datetime.now().isoformat()
+            "running_apps_keys": list(app_manager.running_apps),
+            "app_processes_keys": list(app_manager.app_processes),
+            "running_apps_types": dict(app_manager.app_types)
         }
+        return _ok(debug_info=debug_info, timestamp=_now_iso())
     except Exception as e:
-        return {
-            "status": "error",
-            "error": str(e),
-            "timestamp": datetime.now().isoformat()
+        return _err(str(e), timestamp=_now_iso())
+
+
+@cache
+def _template_listing() -> dict[str, dict[str, Any]]:
+    """Build the list_environment_templates entries; templates are fixed at startup."""
+    return {
+        name: {
+            "name": name,
+            "processes": len(config),
+            "config_preview": tuple(islice(config, 3)),  # Show first 3 commands
+            "description": _get_template_description(name)
         }
+        for name, config in app_manager.environment_templates.items()
+    }
 
 
 @mcp.tool()
@@ -1300,32 +1600,28 @@ def list_environment_templates() -> dict[str, Any]:
     Returns:
         Dictionary of available templates with descriptions.
     """
-    templates = {}
+    templates = _template_listing()
+    return _ok(
+        templates={name: dict(entry) for name, entry in templates.items()},
+        count=len(templates)
+    )
 
-    for name, config in app_manager.environment_templates.items():
-        templates[name] = {
-            "name": name,
-            "processes": len(config),
-            "config_preview": config[:3],  # Show first 3 commands
-            "description": _get_template_description(name)
-        }
 
-    return {
-        "status": "success",
-        "templates": templates,
-        "count": len(templates)
-    }
+_TEMPLATE_DESCRIPTIONS: Final[Mapping[str, str]] = MappingProxyType({
+    "textual_dev": "Single Textual app development with live reload and console",
+    "full_stack": "Complete stack with database, multiple services, and monitoring",
+    "testing_pipeline": "Automated testing workflow with linting, typing, and coverage",
+    "development_stack": "Multi-service development environment with coordination"
+})
 
 
 def _get_template_description(template_name: str) -> str:
     """Get human-readable description of template."""
-    descriptions = {
-        "textual_dev": "Single Textual app development with live reload and console",
-        "full_stack": "Complete stack with database, multiple services, and monitoring",
-        "testing_pipeline": "Automated testing workflow with linting, typing, and coverage",
-        "development_stack": "Multi-service development environment with coordination"
-    }
-    return descriptions.get(template_name, "Custom template")
+    return _TEMPLATE_DESCRIPTIONS.get(template_name, "Custom template")
+
+
+# Customization strings that need no parsing
+_EMPTY_JSON: Final[frozenset[str]] = frozenset({"{}", "null"})
 
 
 @mcp.tool()
@@ -1344,54 +1640,51 @@ async def launch_development_environment(
     """
     try:
         custom_params = {}
-        if customizations:
-            custom_params = json.loads(customizations)
+        if customizations and customizations not in _EMPTY_JSON:
+            custom_params = _json_loads(customizations)
 
         env_id = await app_manager.launch_environment(template, custom_params)
 
-        return {
-            "status": "success",
-            "environment_id": env_id,
-            "template": template,
-            "customizations": custom_params,
-            "message": f"Launched {template} environment with coordinated services",
-            "launched_at": datetime.now().isoformat(),
-            "next_steps": _get_environment_instructions(template)
-        }
+        return _ok(
+            environment_id=env_id,
+            template=template,
+            customizations=custom_params,
+            message=f"Launched {template} environment with coordinated services",
+            launched_at=_now_iso(),
+            next_steps=_get_environment_instructions(template)
+        )
 
     except Exception as e:
-        return {
-            "status": "error",
-            "error": str(e),
-            "template": template
-        }
-
-
-def _get_environment_instructions(template: str) -> list[str]:
+        return _err(str(e), template=template)
+
+
+_ENVIRONMENT_INSTRUCTIONS: Final[Mapping[str, tuple[str, ...]]] = MappingProxyType({
+    "textual_dev": (
+        "Your Textual app is starting with live reload",
+        "Console output will show in separate pane",
+        "Browser will open automatically to app URL"
+    ),
+    "full_stack": (
+        "Database and Redis starting in background",
+        "Multiple Textual services launching on different ports",
+        "Dashboard will open showing all available services"
+    ),
+    "testing_pipeline": (
+        "Automated testing pipeline executing",
+        "Will run linting, type checking, tests, and coverage",
+        "Pipeline completes automatically with summary"
+    ),
+    "development_stack": (
+        "Multiple Textual services coordinating startup",
+        "File manager, API tester, and process monitor launching",
+        "Gateway message will show when all services are ready"
+    )
+})
+
+
+def _get_environment_instructions(template: str) -> tuple[str, ...]:
     """Get user instructions for environment template."""
-    instructions = {
-        "textual_dev": [
-            "Your Textual app is starting with live reload",
-            "Console output will show in separate pane",
-            "Browser will open automatically to app URL"
-        ],
-        "full_stack": [
-            "Database and Redis starting in background",
-            "Multiple Textual services launching on different ports",
-            "Dashboard will open showing all available services"
-        ],
-        "testing_pipeline": [
-            "Automated testing pipeline executing",
-            "Will run linting, type checking, tests, and coverage",
-            "Pipeline completes automatically with summary"
-        ],
-        "development_stack": [
-            "Multiple Textual services coordinating startup",
-            "File manager, API tester, and process monitor launching",
-            "Gateway message will show when all services are ready"
-        ]
-    }
-    return instructions.get(template, ["Environment launching with custom configuration"])
+    return _ENVIRONMENT_INSTRUCTIONS.get(template, ("Environment launching with custom configuration",))
 
 
 @mcp.tool()
@@ -1409,7 +1702,7 @@ async def create_custom_workflow(
         Workflow execution results and process coordination status.
     """
     try:
-        config = json.loads(workflow_config)
+        config = _json_loads(workflow_config)
 
         if not isinstance(config, list):
             raise ValueError("workflow_config must be JSON array of command strings")
@@ -1420,21 +1713,16 @@ async def create_custom_workflow(
 
         env_id = await app_manager.create_custom_environment(config)
 
-        return {
-            "status": "success",
-            "workflow_id": env_id,
-            "config": config,
-            "timeout": timeout,
-            "message": "Custom workflow created with process coordination",
-            "created_at": datetime.now().isoformat()
-        }
+        return _ok(
+            workflow_id=env_id,
+            config=config,
+            timeout=timeout,
+            message="Custom workflow created with process coordination",
+            created_at=_now_iso()
+        )
 
     except Exception as e:
-        return {
-            "status": "error",
-            "error": str(e),
-            "workflow_config": workflow_config
-        }
+        return _err(str(e), workflow_config=workflow_config)
 
 
 @mcp.tool()
@@ -1463,18 +1751,13 @@ async def terminate_environment(env_id: str) -> dict[str, Any]:
     success = await app_manager.terminate_environment(env_id)
 
     if success:
-        return {
-            "status": "success",
-            "env_id": env_id,
-            "message": "Environment terminated gracefully",
-            "terminated_at": datetime.now().isoformat()
-        }
+        return _ok(
+            env_id=env_id,
+            message="Environment terminated gracefully",
+            terminated_at=_now_iso()
+        )
     else:
-        return {
-            "status": "error",
-            "error": f"Environment {env_id} not found",
-            "env_id": env_id
-        }
+        return _err(f"Environment {env_id} not found", env_id=env_id)
 
 
 @mcp.tool()
@@ -1488,11 +1771,7 @@ async def terminate_all_apps() -> dict[str, Any]:
         result = await app_manager.terminate_all_apps()
         return result
     except Exception as e:
-        return {
-            "status": "error",
-            "error": f"Failed to terminate all apps: {e}",
-            "timestamp": datetime.now().isoformat()
-        }
+        return _err(f"Failed to terminate all apps: {e}", timestamp=_now_iso())
 
 
 @mcp.tool()
@@ -1505,14 +1784,10 @@ def get_all_running_processes() -> dict[str, Any]:
     try:
         process_info = app_manager.get_all_running_processes()
         process_info["status"] = "success"
-        process_info["timestamp"] = datetime.now().isoformat()
+        process_info["timestamp"] = _now_iso()
         return process_info
     except Exception as e:
-        return {
-            "status": "error",
-            "error": f"Failed to get process info: {e}",
-            "timestamp": datetime.now().isoformat()
-        }
+        return _err(f"Failed to get process info: {e}", timestamp=_now_iso())
 
 
 @mcp.tool()
@@ -1526,11 +1801,7 @@ async def cleanup_dead_processes() -> dict[str, Any]:
         result = await app_manager.cleanup_dead_processes()
         return result
     except Exception as e:
-        return {
-            "status": "error",
-            "error": f"Failed to cleanup dead processes: {e}",
-            "timestamp": datetime.now().isoformat()
-        }
+        return _err(f"Failed to cleanup dead processes: {e}", timestamp=_now_iso())
 
 
 @mcp.tool()
@@ -1542,64 +1813,160 @@ def list_active_environments() -> dict[str, Any]:
     """
     environments = app_manager.list_environments()
 
-    return {
-        "status": "success",
-        "environments": environments,
-        "count": len(environments),
-        "timestamp": datetime.now().isoformat()
-    }
+    return _ok(environments=environments, count=len(environments), timestamp=_now_iso())
 
 
-def cleanup_processes():
-    """Clean up all running processes and background tasks."""
-    logger.info("Cleaning up Textualize MCP Server...")
+# Set once shutdown has begun, so the signal, main() and atexit paths don't repeat it
+_shutdown_started = False
+_cleanup_done = False
 
-    # Terminate all running apps
-    for app_id in list(app_manager.running_apps.keys()):
-        try:
-            asyncio.run(app_manager.terminate_app(app_id))
-        except Exception as e:
-            logger.error(f"Error terminating app {app_id}: {e}")
 
-    # Terminate all multiplex environments
-    for env_id in list(app_manager.multiplex_environments.keys()):
-        try:
-            asyncio.run(app_manager.terminate_environment(env_id))
-        except Exception as e:
-            logger.error(f"Error terminating environment {env_id}: {e}")
+async def _shutdown_all() -> None:
+    """Terminate all running apps and environments concurrently.
 
-    # Clean up any remaining processes
-    for app_id, process in list(app_manager.app_processes.items()):
+    Only the first call does any work; later calls return immediately.
+    """
+    global _shutdown_started
+    if _shutdown_started:
+        return
+    _shutdown_started = True
+
+    # Stop monitors first so they don't race the terminations below
+    app_manager.cancel_background_tasks()
+
+    app_ids = list(app_manager.running_apps)
+    env_ids = list(app_manager.multiplex_environments)
+    results = await asyncio.gather(
+        *(app_manager.terminate_app(app_id) for app_id in app_ids),
+        *(app_manager.terminate_environment(env_id) for env_id in env_ids),
+        return_exceptions=True
+    )
+    for target_id, result in zip(app_ids + env_ids, results, strict=True):
+        if isinstance(result, Exception):
+            logger.error(f"Error terminating {target_id}: {result}")
+
+
+# Seconds leftover processes get to exit after SIGTERM before they are killed
+_LEFTOVER_GRACE_PERIOD = 2.0
+
+
+def _signal_pids(pids: list[int], signum: int) -> list[int]:
+    """Send a signal to each pid and return those that still existed."""
+    signalled = []
+    for pid in pids:
         try:
-            if process and process.returncode is None:
-                process.terminate()
-        except Exception as e:
-            logger.error(f"Error terminating process for app {app_id}: {e}")
+            os.kill(pid, signum)
+        except ProcessLookupError:
+            continue
+        except OSError as e:
+            logger.error(f"Error signalling process {pid}: {e}")
+            continue
+        signalled.append(pid)
+    return signalled
+
+
+def _reap(pid: int) -> bool:
+    """Reap a child without blocking; True once it has exited or isn't our child."""
+    try:
+        return os.waitpid(pid, os.WNOHANG)[0] != 0
+    except ChildProcessError:
+        return True
+
 
-    app_manager.running_apps.clear()
+def cleanup_processes():
+    """Clean up all running processes and background tasks."""
+    global _cleanup_done
+    if _cleanup_done:
+        return
+    _cleanup_done = True
+    logger.info("Cleaning up Textualize MCP Server...")
+
+    # Terminate all running apps and multiplex environments in one event loop
+    try:
+        asyncio.run(_shutdown_all())
+    except Exception as e:
+        logger.error(f"Error during shutdown: {e}")
+
+    # Signal any remaining processes together, then kill whatever outlives the grace period.
+    # Their event loop is gone by now, so this works on raw pids.
+    leftovers = [process.pid for process in app_manager.app_processes.values() if process.returncode is None]
     app_manager.app_processes.clear()
-    app_manager.multiplex_environments.clear()
+    leftovers = _signal_pids(leftovers, signal.SIGTERM)
+    deadline = time.monotonic() + _LEFTOVER_GRACE_PERIOD
+    while leftovers and time.monotonic() < deadline:
+        time.sleep(0.05)
+        leftovers = [pid for pid in leftovers if not _reap(pid)]
+    _signal_pids(leftovers, getattr(signal, "SIGKILL", signal.SIGTERM))
+
+    app_manager.clear_running_apps()
+    app_manager.app_output_buffers.clear()
+    app_manager.clear_environments()
     logger.info("Cleanup completed")
 
 
-def signal_handler(signum, frame):
-    """Handle shutdown signals."""
-    logger.info(f"Received signal {signum}, shutting down gracefully")
-    cleanup_processes()
-    sys.exit(0)
+# Register cleanup handler for exits that bypass main()
+atexit.register(cleanup_processes)
 
 
-# Register cleanup handlers
-signal.signal(signal.SIGTERM, signal_handler)
-signal.signal(signal.SIGINT, signal_handler)
-atexit.register(cleanup_processes)
+async def _serve() -> None:
+    """Run the stdio MCP server, shutting down in-loop on SIGTERM/SIGINT."""
+    loop = asyncio.get_running_loop()
+    server_task = asyncio.current_task()
+    assert server_task is not None  # asyncio.run always runs _serve as a task
+    shutdown_task: asyncio.Task[None] | None = None
+    serving = True
+
+    def stop_server(_: asyncio.Task[None]) -> None:
+        # Once the server has stopped on its own, its finally block is awaiting us
+        if serving:
+            server_task.cancel()
+
+    def handle_signal(signum: int) -> None:
+        nonlocal shutdown_task
+        if shutdown_task is not None or _shutdown_started:
+            logger.info(f"Received signal {signum}, already shutting down")
+            return
+        logger.info(f"Received signal {signum}, shutting down gracefully")
+        # Shut down first: cancelling the stdio server can block until stdin
+        # delivers another line, which a client holding it open may never send
+        shutdown_task = loop.create_task(_shutdown_all())
+        shutdown_task.add_done_callback(stop_server)
+
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(signum, handle_signal, signum)
+        except NotImplementedError:
+            # Signal handlers are not supported by Windows event loops
+            pass
+
+    try:
+        await mcp.run_stdio_async()
+    except asyncio.CancelledError:
+        pass
+    finally:
+        serving = False
+        if shutdown_task is not None:
+            await shutdown_task
+        else:
+            await _shutdown_all()
+
+
+def _install_uvloop() -> None:
+    """Use uvloop for the server's event loop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Using uvloop event loop")
 
 
 def main():
     """Main entry point for the MCP server."""
+    _install_uvloop()
     try:
-        logger.info(f"Starting Textualize MCP Server with {len(AppRegistry.list_apps())} applications")
-        mcp.run()
+        logger.info(f"Starting Textualize MCP Server with {AppRegistry.count()} applications")
+        asyncio.run(_serve())
     except KeyboardInterrupt:
         logger.info("Server interrupted by user")
     except Exception as e: